@@ -1,6 +1,5 @@
 from __future__ import annotations
 from collections import namedtuple
-from dataclasses import dataclass
 from typing import Any, Dict, List, Literal, NewType, Tuple
 
 import numpy as np
@@ -9,11 +8,31 @@ from matplotlib.axes._axes import Axes as MplAxes
 
 ###############################################################################
 # Points
-@dataclass(order=True)
 class Point:
-    x: int | float
-    y: int | float
-    value: int | float = 0
+    """
+    Lightweight x, y coordinate with an optional value
+
+    Uses ``__slots__`` rather than ``@dataclass`` so that a large point set
+    does not pay for a ``__dict__`` per instance and attribute access stays a
+    C-level slot lookup.
+    """
+
+    __slots__ = ("x", "y", "value")
+
+    def __init__(
+        self, x: int | float, y: int | float, value: int | float = 0
+    ) -> None:
+        self.x = x
+        self.y = y
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"Point(x={self.x!r}, y={self.y!r}, value={self.value!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Point):
+            return NotImplemented
+        return (self.x, self.y, self.value) == (other.x, other.y, other.value)
 
 
 ###############################################################################
@@ -21,11 +40,12 @@ class Point:
 TiledBoundingBox = namedtuple("TiledBoundingBox", ["nw", "ne", "se", "sw"])
 
 
-@dataclass
 class BoundingBox:
     """
     Generic object to represent a bounding box with associated helper functions
 
+    Stored with ``__slots__`` since the quadtrees allocate one per node.
+
     Parameters
     ----------
     lx : int | float
@@ -37,12 +57,6 @@ class BoundingBox:
     by : int | float
         bottom y coord
 
-    Attributes
-    ----------
-    mid : Point
-        Center point of bounding box
-
-
     Class Methods
     -------------
     from_list(point_list: List[float | int])
@@ -68,20 +82,39 @@ class BoundingBox:
         Converts coordinates to an array index starting at [0, 0]
     """
 
-    lx: int | float
-    rx: int | float
-    ty: int | float
-    by: int | float
+    __slots__ = ("lx", "rx", "ty", "by", "mx", "my")
 
-    # def __str__(self) -> str:
-    #    return f"{[self.t, self.r, self.b, self.t]}"
+    def __init__(
+        self,
+        lx: int | float,
+        rx: int | float,
+        ty: int | float,
+        by: int | float,
+    ) -> None:
+        self.lx = lx
+        self.rx = rx
+        self.ty = ty
+        self.by = by
+        # Midpoint cached once; mid_point(), split(), and the quadtree
+        # quadrant dispatch all read the same two values
+        self.mx = (lx + rx) / 2
+        self.my = (ty + by) / 2
+
+    def __repr__(self) -> str:
+        return (
+            f"BoundingBox(lx={self.lx!r}, rx={self.rx!r}, "
+            f"ty={self.ty!r}, by={self.by!r})"
+        )
 
-    def __post_init__(self) -> None:
-        # self.upper_left = [self.l, self.t]
-        # self.lower_right = [self.r, self.b]
-        # self.upper_right = [self.r, self.t]
-        # self.lower_left = [self.l, self.b]
-        self.mid = (self.rx / 2, self.ty / 2)
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BoundingBox):
+            return NotImplemented
+        return (self.lx, self.rx, self.ty, self.by) == (
+            other.lx,
+            other.rx,
+            other.ty,
+            other.by,
+        )
 
     @classmethod
     def from_list(cls, point_list: List[float | int]) -> BoundingBox:
@@ -97,7 +130,7 @@ class BoundingBox:
         -------
         BoundingBox
         """
-        return BoundingBox(**dict(zip(["lx", "rx", "ty", "by"], point_list)))
+        return cls(*point_list)
 
     @classmethod
     def from_numpy(cls, array: np.ndarray[Any, Any]) -> BoundingBox:
@@ -170,7 +203,7 @@ class BoundingBox:
         Point
             Point object with x,y values at center of bounding box
         """
-        return Point((self.rx + self.lx) / 2, (self.ty + self.by) / 2)
+        return Point(self.mx, self.my)
 
     def split(self) -> TiledBoundingBox:
         """
@@ -184,11 +217,11 @@ class BoundingBox:
         TiledBoundingBox
             [TODO:description]
         """
-        mid = self.mid_point()
-        nw = BoundingBox(self.lx, mid.x, self.ty, mid.y)
-        ne = BoundingBox(mid.x, self.rx, self.ty, mid.y)
-        se = BoundingBox(mid.x, self.rx, mid.y, self.by)
-        sw = BoundingBox(self.lx, mid.x, mid.y, self.by)
+        mx, my = self.mx, self.my
+        nw = BoundingBox(self.lx, mx, self.ty, my)
+        ne = BoundingBox(mx, self.rx, self.ty, my)
+        se = BoundingBox(mx, self.rx, my, self.by)
+        sw = BoundingBox(self.lx, mx, my, self.by)
         return TiledBoundingBox(nw=nw, ne=ne, se=se, sw=sw)
 
     def draw(
@@ -238,6 +271,8 @@ class BoundingBox:
         self.by = int(self.by)
         self.lx = int(self.lx)
         self.rx = int(self.rx)
+        self.mx = (self.lx + self.rx) / 2
+        self.my = (self.ty + self.by) / 2
         return self
 
     def to_ij(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
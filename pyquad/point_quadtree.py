@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List
-
-from statistics import StatisticsError, variance
+import array
+from typing import TYPE_CHECKING, Any, List, Tuple
 
+import numpy as np
 
 from matplotlib.axes._axes import Axes as MplAxes
+from matplotlib.collections import LineCollection
 
 if TYPE_CHECKING or __package__:
     from .geometry_objects import BoundingBox, Point
@@ -12,6 +13,78 @@ else:
     from geometry_objects import BoundingBox, Point
 
 
+# Splitting parameters shared by insert() and build()
+VARIANCE_THRESHOLD = 0.08
+MAX_DEPTH = 5
+
+# Grid resolution used for Morton (Z-order) codes; must exceed MAX_DEPTH
+MORTON_BITS = 16
+
+
+def _interleave16(v: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    """
+    Spread the low 16 bits of each element so a zero sits between each bit
+
+    Standard magic-mask bit interleave; two spread coordinates OR'd with a
+    one-bit offset give the Morton code of the pair.
+    """
+    v = v.astype(np.uint32) & np.uint32(0xFFFF)
+    v = (v | (v << 8)) & np.uint32(0x00FF00FF)
+    v = (v | (v << 4)) & np.uint32(0x0F0F0F0F)
+    v = (v | (v << 2)) & np.uint32(0x33333333)
+    v = (v | (v << 1)) & np.uint32(0x55555555)
+    return v
+
+
+def _grid_cells(
+    coords: np.ndarray[Any, Any], lo: float, hi: float
+) -> np.ndarray[Any, Any]:
+    """
+    Quantize coordinates by repeated midpoint bisection
+
+    Each of the MORTON_BITS levels compares against the same
+    ``(lo + hi) / 2`` float midpoint divide() gives the corresponding
+    child box, so the resulting cell indices agree bit-for-bit with the
+    ``>= mx`` tests used everywhere else. A single multiplicative
+    rescale would round differently for points sitting exactly on a
+    midline and file them into the wrong quadrant.
+    """
+    n = coords.shape[0]
+    los = np.full(n, lo, dtype=np.float64)
+    his = np.full(n, hi, dtype=np.float64)
+    q = np.zeros(n, dtype=np.uint32)
+    for _ in range(MORTON_BITS):
+        mid = (los + his) / 2
+        upper = coords >= mid
+        q = (q << 1) | upper.astype(np.uint32)
+        np.copyto(los, mid, where=upper)
+        np.copyto(his, mid, where=~upper)
+    return q
+
+
+def _filter_inside(
+    xy: np.ndarray[Any, Any],
+    values: np.ndarray[Any, Any],
+    bbox: BoundingBox,
+) -> Tuple[np.ndarray[Any, Any], np.ndarray[Any, Any]]:
+    """
+    Drop rows outside the bounding box
+
+    One vectorized mask applying the same half-open containment test
+    insert() uses, so the bulk paths never file a point into a leaf
+    whose box does not contain it.
+    """
+    inside = (
+        (xy[:, 0] >= bbox.lx)
+        & (xy[:, 0] < bbox.rx)
+        & (xy[:, 1] >= bbox.by)
+        & (xy[:, 1] < bbox.ty)
+    )
+    if inside.all():
+        return xy, values
+    return xy[inside], values[inside]
+
+
 ###############################################################################
 # Point quadtree
 
@@ -29,96 +102,378 @@ class PointQuadTree:
         self.children = 0
         self.variance = None
 
-        self.points: List[Point] = []
-        # self.points_num = 0 if points is None else len(points)
+        # Points stored SoA: three parallel coordinate/value columns rather
+        # than a list of boxed Point objects (~24 bytes per point instead of
+        # a Point plus a list cell each)
+        self._xs = array.array("d")
+        self._ys = array.array("d")
+        self._vs = array.array("d")
+
+        # Welford accumulators for the running value variance
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+        self.quads: Tuple[PointQuadTree, ...] | None = None
 
         self._divided = False
 
     def divide(self) -> None:
 
-        tiles = self.bounding_box.split()
+        bbox = self.bounding_box
+        lx, rx = bbox.lx, bbox.rx
+        ty, by = bbox.ty, bbox.by
+        mx, my = bbox.mx, bbox.my
         depth = self.depth + 1
-        self.nw = PointQuadTree(tiles.nw, depth=depth)
-        self.ne = PointQuadTree(tiles.ne, depth=depth)
-        self.se = PointQuadTree(tiles.se, depth=depth)
-        self.sw = PointQuadTree(tiles.sw, depth=depth)
+        # Child boxes built inline from the midpoints computed once;
+        # bounding_box.split() would allocate a Point and a TiledBoundingBox
+        # wrapper on every subdivision.
+        # Quadrant order matches the 2-bit code ((y >= my) << 1) | (x >= mx):
+        # 0 = sw, 1 = se, 2 = nw, 3 = ne
+        self.quads = (
+            PointQuadTree(BoundingBox(lx, mx, my, by), depth=depth),
+            PointQuadTree(BoundingBox(mx, rx, my, by), depth=depth),
+            PointQuadTree(BoundingBox(lx, mx, ty, my), depth=depth),
+            PointQuadTree(BoundingBox(mx, rx, ty, my), depth=depth),
+        )
 
         self._divided = True
 
-    def insert(self, point: Point) -> bool:
+    @property
+    def points(self) -> List[Point]:
+        """Stored points, boxed on demand from the parallel columns."""
+        return [
+            Point(x, y, v)
+            for x, y, v in zip(self._xs, self._ys, self._vs)
+        ]
 
-        if not self.bounding_box.contains(point):
-            return False
+    def _set_points(
+        self,
+        xs: np.ndarray[Any, Any],
+        ys: np.ndarray[Any, Any],
+        vs: np.ndarray[Any, Any],
+    ) -> None:
+        self._xs = array.array("d", xs.tolist())
+        self._ys = array.array("d", ys.tolist())
+        self._vs = array.array("d", vs.tolist())
+        # Seed the Welford accumulators from the slice so a later
+        # insert() continues the running variance over the bulk-loaded
+        # points instead of starting from an empty state
+        n = len(self._vs)
+        self._n = n
+        if n:
+            self._mean = float(vs.mean())
+            self._m2 = float(vs.var()) * n
+        else:
+            self._mean = 0.0
+            self._m2 = 0.0
 
-        self.points.append(point)
-        p_ne = []
-        p_nw = []
-        p_sw = []
-        p_se = []
-        if len(self.points) < 2:
-            return True
+    def build(
+        self, xy: np.ndarray[Any, Any], values: np.ndarray[Any, Any]
+    ) -> None:
+        """
+        Bulk construct the tree from arrays of coordinates and values
+
+        Partitions all points into the four quadrants at once with a
+        vectorized quadrant code rather than recursing per point, so the
+        Python-level work per level is a handful of NumPy calls instead of
+        one call per point.
+
+        Rows outside the tree's bounding box are dropped, mirroring
+        insert(), which rejects such points at its entry check.
+
+        Parameters
+        ----------
+        xy : np.ndarray[Any, Any]
+            (N, 2) array of x, y coordinates
+        values : np.ndarray[Any, Any]
+            (N,) array of values associated with each coordinate
+
+        Returns
+        -------
+        None
+        """
+        # Copy: the build reorders these arrays in place level by level
+        xy = np.array(xy, dtype=np.float64)
+        values = np.array(values, dtype=np.float64)
+        assert xy.ndim == 2 and xy.shape[1] == 2, "xy must be (N, 2)"
+        assert values.shape[0] == xy.shape[0], "values must match xy"
+        xy, values = _filter_inside(xy, values, self.bounding_box)
+        self._build(xy, values, 0, xy.shape[0])
+
+    def _build(
+        self,
+        xy: np.ndarray[Any, Any],
+        values: np.ndarray[Any, Any],
+        lo: int,
+        hi: int,
+    ) -> None:
+        if hi - lo >= 2:
+            # Method form skips np.nanvar's masking copy and the
+            # fromnumeric dispatch layer; matters for the small runs at
+            # deep levels
+            self.variance = float(values[lo:hi].var(ddof=1))
+            if self.variance > VARIANCE_THRESHOLD and self.depth < MAX_DEPTH:
+                self.divide()
+                bbox = self.bounding_box
+                seg_xy = xy[lo:hi]
+                seg_v = values[lo:hi]
+                # Same 2-bit code the insert path uses (0=sw 1=se 2=nw 3=ne);
+                # one stable argsort groups all four quadrants at once, so
+                # each point is touched once per level instead of four times
+                # by per-quadrant boolean masks
+                quad = ((seg_xy[:, 1] >= bbox.my).astype(np.uint8) << 1) | (
+                    seg_xy[:, 0] >= bbox.mx
+                )
+                order = np.argsort(quad, kind="stable")
+                # Reorder this node's run of the shared arrays in place;
+                # every node then covers a contiguous (lo, hi) range and
+                # the recursion allocates nothing per level
+                seg_xy[:] = seg_xy[order]
+                seg_v[:] = seg_v[order]
+                counts = np.bincount(quad, minlength=4)
+                assert self.quads is not None
+                start = lo
+                for node, n in zip(self.quads, counts):
+                    node._build(xy, values, start, start + int(n))
+                    start += int(n)
+                return
+
+        self._set_points(xy[lo:hi, 0], xy[lo:hi, 1], values[lo:hi])
+
+    @classmethod
+    def from_points_bulk(
+        cls,
+        xy: np.ndarray[Any, Any],
+        values: np.ndarray[Any, Any] | None = None,
+        bounding_box: BoundingBox | None = None,
+    ) -> PointQuadTree:
+        """
+        Construct a tree from sorted Morton (Z-order) codes
+
+        Quantizes each coordinate onto a 2^MORTON_BITS grid, interleaves the
+        bits into Morton codes, and sorts once. Every node then covers a
+        contiguous run of the sorted codes, so partitioning a node costs
+        three binary searches instead of scanning its points — the whole
+        build is one O(N log N) sort plus O(nodes) searches.
+
+        Parameters
+        ----------
+        xy : np.ndarray[Any, Any]
+            (N, 2) array of x, y coordinates
+        values : np.ndarray[Any, Any] | None
+            (N,) array of point values, defaults to zeros
+        bounding_box : BoundingBox | None
+            Extent of the tree; derived from the data when not given.
+            When given, points outside it are dropped, mirroring
+            insert(), which rejects such points at its entry check
+
+        Returns
+        -------
+        PointQuadTree
+            Root of the constructed tree
+        """
+        xy = np.asarray(xy, dtype=np.float64)
+        assert xy.ndim == 2 and xy.shape[1] == 2, "xy must be (N, 2)"
+        if values is None:
+            values = np.zeros(xy.shape[0], dtype=np.float64)
         else:
-            try:
-                var = variance(
-                    [
-                        float(pnt.value) if pnt.value != None else 0.0
-                        for pnt in self.points
-                    ]
+            values = np.asarray(values, dtype=np.float64)
+
+        if bounding_box is None:
+            if xy.shape[0] == 0:
+                raise ValueError(
+                    "cannot derive a bounding box from empty xy; "
+                    "pass bounding_box explicitly"
                 )
-            except StatisticsError as e:
-                raise e
-            assert isinstance(var, float)
-            if var > 0.08 and self.depth < 5:
-                mid = Point(
-                    self.bounding_box.rx // 2, self.bounding_box.ty // 2
+            lx, by = xy.min(axis=0)
+            rx, ty = xy.max(axis=0)
+            # Half-open bounds: pad the max edge so extreme points stay in
+            pad = max(float(rx - lx), float(ty - by), 1.0) * 1e-6
+            bounding_box = BoundingBox(
+                float(lx), float(rx) + pad, float(ty) + pad, float(by)
+            )
+        else:
+            # Quantization would otherwise clamp outside points into the
+            # edge grid cells and store them in leaves whose boxes do
+            # not contain them
+            xy, values = _filter_inside(xy, values, bounding_box)
+
+        qx = _grid_cells(xy[:, 0], bounding_box.lx, bounding_box.rx)
+        qy = _grid_cells(xy[:, 1], bounding_box.by, bounding_box.ty)
+        code = (_interleave16(qy) << 1) | _interleave16(qx)
+
+        order = np.argsort(code, kind="stable")
+
+        tree = cls(bounding_box)
+        tree._build_morton(
+            xy[order], values[order], code[order], 0, xy.shape[0]
+        )
+        return tree
+
+    def _build_morton(
+        self,
+        xy: np.ndarray[Any, Any],
+        values: np.ndarray[Any, Any],
+        code: np.ndarray[Any, Any],
+        lo: int,
+        hi: int,
+    ) -> None:
+        if hi - lo >= 2:
+            # Method form skips np.nanvar's masking copy and the
+            # fromnumeric dispatch layer; matters for the small runs at
+            # deep levels
+            self.variance = float(values[lo:hi].var(ddof=1))
+            if self.variance > VARIANCE_THRESHOLD and self.depth < MAX_DEPTH:
+                self.divide()
+                assert self.quads is not None
+                # Two code bits per level; this node's run splits at the
+                # codes where the quadrant pair for its depth increments
+                shift = 2 * (MORTON_BITS - 1 - self.depth)
+                seg = code[lo:hi]
+                prefix = (int(seg[0]) >> (shift + 2)) << (shift + 2)
+                bounds = (
+                    lo,
+                    lo + int(np.searchsorted(seg, prefix | (1 << shift))),
+                    lo + int(np.searchsorted(seg, prefix | (2 << shift))),
+                    lo + int(np.searchsorted(seg, prefix | (3 << shift))),
+                    hi,
                 )
-                # Computational Geometry Algorithms & Applications 3ed
-                # Berg et al., pg. 310
-                tiled = self.bounding_box.split()
-                for pnt in self.points:
-                    if pnt.x > mid.x and pnt.y > mid.y:
-                        p_ne.append(pnt)
-                    elif pnt.x <= mid.x and pnt.y > mid.y:
-                        p_nw.append(pnt)
-                    elif pnt.x <= mid.x and pnt.y <= mid.y:
-                        p_sw.append(pnt)
-                    elif pnt.x > mid.x and pnt.y <= mid.y:
-                        p_se.append(pnt)
-
-        if not self._divided:
+                # Morton quadrant (y_bit << 1) | x_bit matches quads order
+                for q, node in enumerate(self.quads):
+                    node._build_morton(
+                        xy, values, code, bounds[q], bounds[q + 1]
+                    )
+                return
+
+        self._set_points(xy[lo:hi, 0], xy[lo:hi, 1], values[lo:hi])
+
+    def insert(self, point: Point) -> bool:
+
+        # Unbox once at the boundary; the recursion below works on plain
+        # floats so nothing re-reads Point attributes per level.
+        # BoundingBox.contains inlined: bound-method dispatch plus repeated
+        # attribute loads dominate for a predicate this small.
+        px, py = point.x, point.y
+        bbox = self.bounding_box
+        if not (bbox.lx <= px < bbox.rx and bbox.by <= py < bbox.ty):
+            return False
+
+        v = float(point.value) if point.value is not None else 0.0
+        return self._insert(px, py, v)
+
+    def _insert(self, px: int | float, py: int | float, v: float) -> bool:
+
+        # Containment is checked once at the public entry point; quadrant
+        # dispatch guarantees every recursive call lands in the right box
+        if self._divided:
+            # Internal node: points live in the leaves, recurse directly
+            return self._child_for(px, py)._insert(px, py, v)
+
+        self._xs.append(px)
+        self._ys.append(py)
+        self._vs.append(v)
+        # Welford's online update: O(1) per insert instead of recomputing
+        # the full sample variance over the point list every time
+        self._n += 1
+        delta = v - self._mean
+        self._mean += delta / self._n
+        self._m2 += delta * (v - self._mean)
+        if self._n < 2:
+            return True
+
+        var = self._m2 / (self._n - 1)
+        self.variance = var
+        if var > VARIANCE_THRESHOLD and self.depth < MAX_DEPTH:
+            # Computational Geometry Algorithms & Applications 3ed
+            # Berg et al., pg. 310
             self.divide()
+            # Hand each stored point to its quadrant exactly once; this
+            # node is now internal and no longer stores points itself.
+            # Branchless 2-bit bin selection with the midpoints hoisted
+            # out of the loop; quads order is sw, se, nw, ne.
+            quads = self.quads
+            assert quads is not None
+            bbox = self.bounding_box
+            mx, my = bbox.mx, bbox.my
+            for x, y, val in zip(self._xs, self._ys, self._vs):
+                quads[((y >= my) << 1) | (x >= mx)]._insert(x, y, val)
+            self._xs = array.array("d")
+            self._ys = array.array("d")
+            self._vs = array.array("d")
 
-        return (
-            self.ne.insert(point)
-            or self.nw.insert(point)
-            or self.se.insert(point)
-            or self.sw.insert(point)
-        )
+        return True
+
+    def _child_for(self, px: int | float, py: int | float) -> PointQuadTree:
+        bbox = self.bounding_box
+        assert self.quads is not None
+        return self.quads[((py >= bbox.my) << 1) | (px >= bbox.mx)]
 
     def __str__(self) -> str:
-        sp = " " * self.depth * 2
-        s = str(self.bounding_box) + "\n"
-        s += sp + ", ".join(str(point) for point in self.points)
-        if not self._divided:
-            return s
-        return (
-            s
-            + "\n"
-            + "\n".join(
-                [
-                    sp + "nw: " + str(self.nw),
-                    sp + "ne: " + str(self.ne),
-                    sp + "se: " + str(self.se),
-                    sp + "sw: " + str(self.sw),
-                ]
-            )
-        )
+        # Iterative depth-first walk collecting lines and joining once;
+        # recursive concatenation copies each subtree's text at every level
+        lines = []
+        stack: List[Tuple[str, PointQuadTree]] = [("", self)]
+        while stack:
+            label, node = stack.pop()
+            sp = " " * node.depth * 2
+            lines.append(sp + label + str(node.bounding_box))
+            if len(node._vs):
+                lines.append(
+                    sp + ", ".join(str(point) for point in node.points)
+                )
+            if node._divided and node.quads is not None:
+                # Push in reverse so children pop in nw, ne, se, sw
+                # order (quads is stored sw, se, nw, ne)
+                quads = node.quads
+                for name, quad in (
+                    ("sw", quads[0]),
+                    ("se", quads[1]),
+                    ("ne", quads[3]),
+                    ("nw", quads[2]),
+                ):
+                    stack.append((name + ": ", quad))
+        return "\n".join(lines)
 
-    def draw(self, ax: MplAxes) -> None:
+    def draw(
+        self, ax: MplAxes, c: str = "k", lw: int | float = 0.1
+    ) -> None:
+        """
+        Draw every node's bounding box as a single LineCollection
 
-        self.bounding_box.draw(ax)
-        if self._divided:
-            self.nw.draw(ax)
-            self.ne.draw(ax)
-            self.se.draw(ax)
-            self.sw.draw(ax)
+        One artist for the whole tree keeps matplotlib overhead constant in
+        the number of nodes; per-box ax.plot would create one Line2D each.
+
+        Parameters
+        ----------
+        ax : MplAxes
+            matplotlib axis object
+        c : str
+            color (default is "k")
+        lw : int | float
+            line width (default is 0.1)
+
+        Returns
+        -------
+        None
+        """
+        segments = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            bbox = node.bounding_box
+            x1, y1 = bbox.lx, bbox.ty
+            x2, y2 = bbox.rx, bbox.by
+            segments.append(
+                ((x1, y1), (x2, y1), (x2, y2), (x1, y2), (x1, y1))
+            )
+            if node._divided and node.quads is not None:
+                stack.extend(node.quads)
+        ax.add_collection(
+            LineCollection(
+                np.asarray(segments, dtype=np.float32),
+                colors=c,
+                linewidths=lw,
+            )
+        )
+        ax.autoscale_view()
@@ -1,8 +1,12 @@
 from __future__ import annotations
-from typing import Any, Callable, Dict, TYPE_CHECKING, Union
+import io
+import math
+from typing import Any, Callable, Dict, TYPE_CHECKING, Tuple, Union
 
 from matplotlib.axes._axes import Axes as MplAxes
+from matplotlib.collections import LineCollection
 import numpy as np
+from numba import njit, prange
 
 if TYPE_CHECKING or __package__:
     from .geometry_objects import BoundingBox
@@ -16,6 +20,217 @@ CHILDREN_NAMES = ["nw", "ne", "se", "sw"]
 TArray2D = np.ndarray[Any, Any]
 
 
+@njit(cache=True, parallel=True)
+def _float_tables(array: TArray2D) -> Tuple[Any, Any]:
+    """
+    Float64 integral images of the values and squared values
+
+    Accumulates values shifted by the global mean: variance is shift
+    invariant, and centering keeps the sum-of-squares table from
+    cancelling catastrophically on large offsets (the same conditioning
+    concern Welford's update addresses for the streaming case). Tables
+    are padded with a zero row/column so corner reads need no bounds
+    checks.
+
+    Built in two separable passes so each can run in parallel: row
+    prefix sums with rows independent, then column accumulation with
+    columns independent.
+    """
+    h, w = array.shape
+    mean0 = np.mean(array)
+    sat = np.zeros((h + 1, w + 1), np.float64)
+    sat2 = np.zeros((h + 1, w + 1), np.float64)
+    for i in prange(h):
+        row = 0.0
+        row2 = 0.0
+        for j in range(w):
+            v = float(array[i, j]) - mean0
+            row += v
+            row2 += v * v
+            sat[i + 1, j + 1] = row
+            sat2[i + 1, j + 1] = row2
+    for j in prange(1, w + 1):
+        for i in range(1, h + 1):
+            sat[i, j] += sat[i - 1, j]
+            sat2[i, j] += sat2[i - 1, j]
+    return sat, sat2
+
+
+@njit(cache=True, parallel=True)
+def _int_tables(array: TArray2D) -> Tuple[Any, Any]:
+    """
+    Exact int64 integral images for small integer rasters
+
+    For uint8/int16-class input the sums fit int64 with room to spare
+    (worst case 2^32 per squared value), so the tables stay in integer
+    arithmetic: no rounding, no mean-centering needed, and the inner
+    accumulation avoids int-to-float conversion per pixel. Same
+    two-pass parallel structure as the float tables.
+    """
+    h, w = array.shape
+    sat = np.zeros((h + 1, w + 1), np.int64)
+    sat2 = np.zeros((h + 1, w + 1), np.int64)
+    for i in prange(h):
+        row = np.int64(0)
+        row2 = np.int64(0)
+        for j in range(w):
+            v = np.int64(array[i, j])
+            row += v
+            row2 += v * v
+            sat[i + 1, j + 1] = row
+            sat2[i + 1, j + 1] = row2
+    for j in prange(1, w + 1):
+        for i in range(1, h + 1):
+            sat[i, j] += sat[i - 1, j]
+            sat2[i, j] += sat2[i - 1, j]
+    return sat, sat2
+
+
+@njit(cache=True)
+def _split_worklist(
+    sat: TArray2D,
+    sat2: TArray2D,
+    max_depth: int,
+    thresh: float,
+    use_std: bool,
+    min_size: int,
+) -> Tuple[Any, Any, Any, Any, Any, Any, Any]:
+    """
+    Iterative build of the tree structure for np.std / np.var criteria
+
+    Works through a flat worklist of (ty, by, lx, rx, depth) records instead
+    of Python recursion, so the whole build compiles to one machine-code
+    loop. Any tile's std is four corner reads per integral table instead
+    of a scan, making the criteria O(1) per node regardless of tile size;
+    Numba specializes the loop for the table dtype (int64 or float64).
+    Records live in a preallocated flat int array grown by doubling, so
+    the hot loop never touches a boxed container. A node's four children
+    are appended contiguously in nw, ne, se, sw order; ``child[i]`` is
+    the index of node i's first child, or -1 for a leaf.
+    """
+    h = sat.shape[0] - 1
+    w = sat.shape[1] - 1
+
+    # Columns: ty, by, lx, rx, depth, child
+    cap = 4096
+    recs = np.empty((cap, 6), np.int64)
+    crit_a = np.empty(cap, np.float64)
+    recs[0, 0] = 0
+    recs[0, 1] = h
+    recs[0, 2] = 0
+    recs[0, 3] = w
+    recs[0, 4] = 0
+    recs[0, 5] = -1
+    count = 1
+
+    depth_budget = max_depth
+    head = 0
+    while head < count:
+        ty = recs[head, 0]
+        by = recs[head, 1]
+        lx = recs[head, 2]
+        rx = recs[head, 3]
+        depth = recs[head, 4]
+
+        n = (by - ty) * (rx - lx)
+        if n == 0:
+            crit = np.nan
+        else:
+            # Tile std from the 4-corner inclusion-exclusion reads
+            s = sat[by, rx] - sat[ty, rx] - sat[by, lx] + sat[ty, lx]
+            s2 = (
+                sat2[by, rx] - sat2[ty, rx] - sat2[by, lx] + sat2[ty, lx]
+            )
+            var = s2 / n - (s / n) ** 2
+            # One-pass variance can go slightly negative for uniform tiles
+            if var < 0.0:
+                var = 0.0
+            crit = np.sqrt(var) if use_std else var
+        crit_a[head] = crit
+
+        # Root is always split; everything else splits while there is too
+        # much detail, the depth budget allows, and the children would
+        # stay at least min_size on a side
+        if depth == 0:
+            # Match the Python fallback: when the root's own criteria
+            # fails the split test, the forced root split is all that
+            # happens — cap the budget so the four children stay leaves
+            if (
+                max_depth <= 0
+                or np.isnan(crit)
+                or crit <= thresh
+                or by - ty < 2 * min_size
+                or rx - lx < 2 * min_size
+            ):
+                depth_budget = 1
+            do_split = True
+        else:
+            do_split = (
+                depth < depth_budget
+                and crit > thresh
+                and by - ty >= 2 * min_size
+                and rx - lx >= 2 * min_size
+            )
+        if do_split:
+            if count + 4 > cap:
+                cap *= 2
+                new_recs = np.empty((cap, 6), np.int64)
+                new_recs[:count] = recs[:count]
+                recs = new_recs
+                new_crit = np.empty(cap, np.float64)
+                new_crit[:count] = crit_a[:count]
+                crit_a = new_crit
+            my = (ty + by) // 2
+            mx = (lx + rx) // 2
+            recs[head, 5] = count
+            for c_ty, c_by, c_lx, c_rx in (
+                (ty, my, lx, mx),
+                (ty, my, mx, rx),
+                (my, by, mx, rx),
+                (my, by, lx, mx),
+            ):
+                recs[count, 0] = c_ty
+                recs[count, 1] = c_by
+                recs[count, 2] = c_lx
+                recs[count, 3] = c_rx
+                recs[count, 4] = depth + 1
+                recs[count, 5] = -1
+                count += 1
+
+        head += 1
+
+    return (
+        recs[:count, 0],
+        recs[:count, 1],
+        recs[:count, 2],
+        recs[:count, 3],
+        recs[:count, 4],
+        crit_a[:count],
+        recs[:count, 5],
+    )
+
+
+def _build_std_kernel(
+    array: TArray2D,
+    max_depth: int,
+    thresh: float,
+    use_std: bool,
+    min_size: int,
+) -> Tuple[Any, Any, Any, Any, Any, Any, Any]:
+    """
+    Build the flat tree records, picking integral tables by dtype
+
+    Rasters in uint8/int16-class dtypes get exact int64 tables (cheaper
+    accumulation, no float rounding); everything else goes through the
+    mean-centered float64 tables.
+    """
+    if array.dtype.kind in "iu" and array.dtype.itemsize <= 2:
+        sat, sat2 = _int_tables(array)
+    else:
+        sat, sat2 = _float_tables(array)
+    return _split_worklist(sat, sat2, max_depth, thresh, use_std, min_size)
+
+
 class RegionNode:
     """Node class for region quadtree
 
@@ -27,6 +242,9 @@ class RegionNode:
         Numpy array of 2 dimensions
     bounding_box : BoundingBox | None
         Bounding box, optional. If not specified then the bounding box is generated from `array` bounds.
+    bounds : Tuple[int, int, int, int] | None
+        (ty, by, lx, rx) integer extents, optional. The cheap form used on
+        the hot build path; takes precedence over `bounding_box`.
     depth : int
         Depth of the node within the tree, optional. Default is 0.
     split_func : Callable[[TArray2D], Any]
@@ -35,15 +253,14 @@ class RegionNode:
 
     Attributes
     ----------
+    ty, by, lx, rx: int
+        Integer extents of the node within the root array
     bounding_box: BoundingBox
-        Bounding box of node
+        Bounding box of node, constructed lazily from the integer extents
     depth: int
         Depth of node
-    nw
-    ne
-    se
-    sw: RegionNode | None
-        Child nodes, if None then no children
+    quads: Tuple[RegionNode, ...] | None
+        Child nodes in nw, ne, se, sw order, if None then no children
 
     val: int | float
         Assigned value for node
@@ -65,22 +282,67 @@ class RegionNode:
 
     """
 
+    # Trees routinely hold 10^4+ nodes; slots drop the per-node __dict__
+    __slots__ = (
+        "ty",
+        "by",
+        "lx",
+        "rx",
+        "_bounding_box",
+        "depth",
+        "children",
+        "val",
+        "split_criteria",
+        "split_func",
+        "data",
+        "_divided",
+        "_leaf",
+        "quads",
+    )
+
     def __init__(
         self,
         array: TArray2D,
         *,
         bounding_box: BoundingBox | None = None,
+        bounds: Tuple[int, int, int, int] | None = None,
         depth: int = 0,
         split_func: Callable[[TArray2D], Any] = np.std,
     ) -> None:
-        self.bounding_box = (
-            bounding_box if bounding_box else BoundingBox.from_numpy(array)
-        )
+        # Nodes carry four plain ints; the BoundingBox object is only
+        # materialized when someone asks for it (draw, __str__)
+        if bounds is not None:
+            self.ty, self.by, self.lx, self.rx = bounds
+            self._bounding_box: BoundingBox | None = None
+        elif bounding_box is not None:
+            self.ty, self.by = int(bounding_box.ty), int(bounding_box.by)
+            self.lx, self.rx = int(bounding_box.lx), int(bounding_box.rx)
+            self._bounding_box = bounding_box
+        else:
+            i, j = array.shape
+            self.ty, self.by, self.lx, self.rx = 0, int(i), 0, int(j)
+            self._bounding_box = None
 
         self.depth = depth
         self.children = 0
         try:
-            self.val = self.split_criteria = split_func(array.flatten())
+            if array.size == 0:
+                self.val = self.split_criteria = 0
+            elif array.min() == array.max():
+                # Uniform tile (nodata masks, flat background): a single
+                # min/max pass short-circuits the criteria reduction and
+                # the node becomes a leaf
+                self.val = self.split_criteria = 0
+            elif split_func is np.std:
+                # Method form bypasses the fromnumeric dispatch wrapper,
+                # which is real overhead on the small tiles at deep levels
+                self.val = self.split_criteria = array.std()
+            elif split_func is np.var:
+                self.val = self.split_criteria = array.var()
+            else:
+                # Pass the 2D view directly; flatten() would copy the
+                # slice on every node. NumPy reductions handle ND input.
+                self.val = self.split_criteria = split_func(array)
         except ZeroDivisionError:
             self.val = self.split_criteria = None
         self.split_func = split_func
@@ -90,10 +352,45 @@ class RegionNode:
         self._divided = False
         self._leaf = True
 
-        self.nw: RegionNode | None = None
-        self.ne: RegionNode | None = None
-        self.se: RegionNode | None = None
-        self.sw: RegionNode | None = None
+        self.quads: Tuple[RegionNode, ...] | None = None
+
+    @property
+    def bounding_box(self) -> BoundingBox:
+        """Bounding box of the node, built on demand from the int extents."""
+        bbox = self._bounding_box
+        if bbox is None:
+            bbox = self._bounding_box = BoundingBox(
+                self.lx, self.rx, self.ty, self.by
+            )
+        return bbox
+
+    @classmethod
+    def _from_record(
+        cls,
+        data: TArray2D,
+        bounds: Tuple[int, int, int, int],
+        depth: int,
+        split_criteria: float,
+        split_func: Callable[[TArray2D], Any],
+    ) -> RegionNode:
+        """
+        Construct a node from a precomputed build record
+
+        Used by the jitted build path, where the splitting criteria has
+        already been evaluated inside the kernel.
+        """
+        node = cls.__new__(cls)
+        node.ty, node.by, node.lx, node.rx = bounds
+        node._bounding_box = None
+        node.depth = depth
+        node.children = 0
+        node.val = node.split_criteria = split_criteria
+        node.split_func = split_func
+        node.data = data
+        node._divided = False
+        node._leaf = True
+        node.quads = None
+        return node
 
     def split(self, array: TArray2D) -> None:
         """
@@ -105,16 +402,39 @@ class RegionNode:
         """
 
         depth = self.depth + 1
-        split_bbox = self.bounding_box.split()
-        for children in CHILDREN_NAMES:
-
-            bbox = getattr(split_bbox, children).to_int()
-            self.__dict__[children] = RegionNode(
-                array[bbox.ty : bbox.by, bbox.lx : bbox.rx],
-                depth=depth,
-                bounding_box=bbox,
-                split_func=self.split_func,
-            )
+        ty, by = self.ty, self.by
+        lx, rx = self.lx, self.rx
+        my = (ty + by) // 2
+        mx = (lx + rx) // 2
+        split_func = self.split_func
+        # Children get plain integer bounds; no BoundingBox is allocated
+        # on the build path. Order is nw, ne, se, sw to match
+        # CHILDREN_NAMES.
+        nw = RegionNode(
+            array[ty:my, lx:mx],
+            depth=depth,
+            bounds=(ty, my, lx, mx),
+            split_func=split_func,
+        )
+        ne = RegionNode(
+            array[ty:my, mx:rx],
+            depth=depth,
+            bounds=(ty, my, mx, rx),
+            split_func=split_func,
+        )
+        se = RegionNode(
+            array[my:by, mx:rx],
+            depth=depth,
+            bounds=(my, by, mx, rx),
+            split_func=split_func,
+        )
+        sw = RegionNode(
+            array[my:by, lx:mx],
+            depth=depth,
+            bounds=(my, by, lx, mx),
+            split_func=split_func,
+        )
+        self.quads = (nw, ne, se, sw)
 
         self._divided = True
         self._leaf = False
@@ -138,38 +458,44 @@ class RegionNode:
         None
         """
 
-        self.bounding_box.draw(ax, **kwargs)
-        if self._divided:
-            self.nw.draw(ax, **kwargs) if self.nw else None
-            self.ne.draw(ax, **kwargs) if self.ne else None
-            self.se.draw(ax, **kwargs) if self.se else None
-            self.sw.draw(ax, **kwargs) if self.sw else None
+        # Explicit stack instead of recursion: one loop iteration is far
+        # cheaper than a Python frame per node
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node.bounding_box.draw(ax, **kwargs)
+            if node._divided and node.quads is not None:
+                stack.extend(node.quads)
 
     def __str__(self) -> str:
         """
-        Recursively represent tree for stdout
+        Represent subtree for stdout
+
+        Iterative depth-first walk writing into one StringIO buffer;
+        recursive concatenation would re-copy every subtree's text at
+        each level above it.
 
         Returns
         -------
         str
         """
-        sp = " " * self.depth * 2
-        s = (
-            f"depth={self.depth}"
-            f"\ndecomp={self.split_criteria}"
-            f"\ndata={self.data.shape if isinstance(self.data, np.ndarray) else None}"
-            f"{self.bounding_box}\n"
-        )
-        if not self._divided:
-            return s
-        return f"{s if self.data != None else None} \n".join(
-            [
-                sp + "nw: " + str(self.nw),
-                sp + "ne: " + str(self.ne),
-                sp + "se: " + str(self.se),
-                sp + "sw: " + str(self.sw),
-            ]
-        )
+        buf = io.StringIO()
+        stack: list[Tuple[str, RegionNode]] = [("", self)]
+        while stack:
+            label, node = stack.pop()
+            buf.write(" " * node.depth * 2)
+            buf.write(label)
+            buf.write(
+                f"depth={node.depth} "
+                f"decomp={node.split_criteria} "
+                f"{node.bounding_box}\n"
+            )
+            if node._divided and node.quads is not None:
+                for name, quad in zip(
+                    reversed(CHILDREN_NAMES), reversed(node.quads)
+                ):
+                    stack.append((name + ": ", quad))
+        return buf.getvalue()
 
     @property
     def leaf(self) -> bool:
@@ -197,6 +523,10 @@ class RegionQuadTree:
     split_thresh: int | float
         The threhold with which to determine to continue splitting or not.
         I.e. if split_func(A) <= split_thresh then stop recursion and make node the leaf.
+    min_size: int
+        Smallest tile edge a split may produce; a node only subdivides
+        when all four children would be at least this wide and tall.
+        Default is 0, which keeps the depth budget as the only size limit.
 
 
     Class Attributes
@@ -214,6 +544,16 @@ class RegionQuadTree:
 
     """
 
+    __slots__ = (
+        "max_depth",
+        "split_func",
+        "split_thresh",
+        "min_size",
+        "_records",
+        "_root",
+        "_array",
+    )
+
     def __init__(
         self,
         array: TArray2D,
@@ -221,10 +561,12 @@ class RegionQuadTree:
         max_depth: int = 7,
         split_func: Callable[[TArray2D], Any] = np.std,
         split_thresh: int | float = 1,
+        min_size: int = 0,
     ) -> None:
         self.max_depth = max_depth
         self.split_func = split_func
         self.split_thresh = split_thresh
+        self.min_size = min_size
         self.__start(array)
 
     def __start(self, array: TArray2D) -> None:
@@ -241,11 +583,76 @@ class RegionQuadTree:
         None
         """
 
+        self._records: Tuple[Any, ...] | None = None
+        self._root: RegionNode | None = None
+        self._array = array
+
+        if self.split_func is np.std or self.split_func is np.var:
+            # std/var criteria: build the structure in one jitted pass and
+            # keep the flat records; Python nodes are materialized lazily
+            # the first time someone navigates the tree
+            self._records = _build_std_kernel(
+                np.ascontiguousarray(array),
+                self.max_depth,
+                float(self.split_thresh),
+                self.split_func is np.std,
+                int(self.min_size),
+            )
+            return
+
         # create initial root
-        self.root = RegionNode(array, split_func=self.split_func)
+        self._root = RegionNode(array, split_func=self.split_func)
 
         # build quadtree
-        self.__build(self.root, array)
+        self.__build(self._root, array)
+
+    @property
+    def root(self) -> RegionNode:
+        """Root node of the tree, built on demand from the flat records."""
+        if self._root is None:
+            assert self._records is not None
+            self._root = self.__nodes_from_records()
+        return self._root
+
+    def __nodes_from_records(self) -> RegionNode:
+        """
+        Materialize the RegionNode tree from the _build_std_kernel records
+
+        The records act as a dense node pool: child indices are sequential
+        ints into contiguous arrays, so the whole tree is wired up without
+        any per-node criteria evaluation.
+
+        Returns
+        -------
+        RegionNode
+            Root node of the constructed tree
+        """
+        assert self._records is not None
+        array = self._array
+        ty, by, lx, rx, depth, crit, child = self._records
+        nodes = [
+            RegionNode._from_record(
+                array[ty[i] : by[i], lx[i] : rx[i]],
+                (int(ty[i]), int(by[i]), int(lx[i]), int(rx[i])),
+                int(depth[i]),
+                float(crit[i]),
+                self.split_func,
+            )
+            for i in range(ty.shape[0])
+        ]
+        for i, c in enumerate(child):
+            if c >= 0:
+                node = nodes[i]
+                node.quads = (
+                    nodes[c],
+                    nodes[c + 1],
+                    nodes[c + 2],
+                    nodes[c + 3],
+                )
+                node._divided = True
+                node._leaf = False
+                node.data = None
+        return nodes[0]
 
     def __build(self, node: RegionNode, array: TArray2D) -> None:
         """
@@ -268,44 +675,100 @@ class RegionQuadTree:
         if not node:
             return
 
-        # Ensure root is split
-        if node.depth == 0:
-            node.split(array)
-
-        if (
-            node.depth >= self.max_depth
-            or node.split_criteria <= self.split_thresh
-        ):
-            if node.depth > self.max_depth:
-                self.max_depth = node.depth
-
-            # assign quadrant to leaf and stop recursing
-            node.leaf = True
-
-            return
-
-        # split quadrant if there is too much detail
-        node.split(array)
-
-        for children in CHILDREN_NAMES:
-            self.__build(node.__dict__[children], array)
+        # Worklist instead of recursive calls; each node is handled in one
+        # loop iteration rather than its own Python frame
+        stack = [node]
+        while stack:
+            current = stack.pop()
+
+            # Ensure root is split
+            if current.depth == 0:
+                current.split(array)
+
+            # Cheap depth guard first; None/NaN criteria (empty or
+            # degenerate tiles) must become leaves, not recurse to
+            # max_depth — NaN compares False against the threshold
+            crit = current.split_criteria
+            if (
+                current.depth >= self.max_depth
+                or crit is None
+                or math.isnan(crit)
+                or crit <= self.split_thresh
+                or current.by - current.ty < 2 * self.min_size
+                or current.rx - current.lx < 2 * self.min_size
+            ):
+                if current.depth > self.max_depth:
+                    self.max_depth = current.depth
+
+                # assign quadrant to leaf and stop recursing
+                current.leaf = True
+
+                continue
+
+            # split quadrant if there is too much detail
+            current.split(array)
+
+            assert current.quads is not None
+            stack.extend(current.quads)
 
     def draw(
         self,
         ax: MplAxes,
-        **kwargs: Dict[Any, Any],
+        c: str = "k",
+        lw: int | float = 0.1,
     ) -> None:
         """
         Visualize quadtree
 
+        Collects every node's bounding box into one LineCollection so the
+        whole tree is a single matplotlib artist; RegionNode.draw remains
+        for inspecting individual subtrees.
+
         Parameters
         ----------
         ax : MplAxes
             MatplotLib axes object
+        c : str
+            color (default is "k")
+        lw : int | float
+            line width (default is 0.1)
 
         Returns
         -------
         None
         """
 
-        self.root.draw(ax, **kwargs)
+        if self._records is not None:
+            # Jitted build: box corners come straight out of the flat
+            # record arrays without materializing any Python nodes
+            ty, by, lx, rx = (
+                a.astype(np.float32) for a in self._records[:4]
+            )
+            segments = np.empty((ty.shape[0], 5, 2), dtype=np.float32)
+            segments[:, 0, 0] = lx
+            segments[:, 0, 1] = ty
+            segments[:, 1, 0] = rx
+            segments[:, 1, 1] = ty
+            segments[:, 2, 0] = rx
+            segments[:, 2, 1] = by
+            segments[:, 3, 0] = lx
+            segments[:, 3, 1] = by
+            segments[:, 4] = segments[:, 0]
+        else:
+            seg_list = []
+            stack = [self.root]
+            while stack:
+                node = stack.pop()
+                bbox = node.bounding_box
+                x1, y1 = bbox.lx, bbox.ty
+                x2, y2 = bbox.rx, bbox.by
+                seg_list.append(
+                    ((x1, y1), (x2, y1), (x2, y2), (x1, y2), (x1, y1))
+                )
+                if node._divided and node.quads is not None:
+                    stack.extend(node.quads)
+            segments = np.asarray(seg_list, dtype=np.float32)
+        ax.add_collection(
+            LineCollection(segments, colors=c, linewidths=lw)
+        )
+        ax.autoscale_view()
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from pyquad import PointQuadTree
+from pyquad.geometry_objects import BoundingBox
+
+
+def leaf_containment_violations(tree):
+    """Count stored points whose leaf bounding box does not contain them."""
+    bad = 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        bbox = node.bounding_box
+        for x, y in zip(node._xs, node._ys):
+            if not (bbox.lx <= x < bbox.rx and bbox.by <= y < bbox.ty):
+                bad += 1
+        if node._divided:
+            stack.extend(node.quads)
+    return bad
+
+
+def stored_point_count(tree):
+    total = 0
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        total += len(node._vs)
+        if node._divided:
+            stack.extend(node.quads)
+    return total
+
+
+def tree_midlines(lo, hi, depth):
+    """The exact float midpoints divide() produces down to `depth`."""
+    mids = []
+
+    def rec(a, b, d):
+        if d == 0:
+            return
+        m = (a + b) / 2
+        mids.append(m)
+        rec(a, m, d - 1)
+        rec(m, b, d - 1)
+
+    rec(lo, hi, depth)
+    return mids
+
+
+def test_from_points_bulk_midline_points_stay_contained():
+    # Points sitting exactly on quadrant midlines (common for gridded
+    # data) must land on the same side the >= mx float test puts them
+    rng = np.random.default_rng(7)
+    for _ in range(40):
+        lx, by = rng.random(2) * 10
+        rx = lx + 1.0 + rng.random() * 90
+        ty = by + 1.0 + rng.random() * 90
+        bbox = BoundingBox(lx, rx, ty, by)
+
+        xy = np.column_stack(
+            [rng.uniform(lx, rx, 300), rng.uniform(by, ty, 300)]
+        )
+        x_mids = tree_midlines(lx, rx, 4)
+        y_mids = tree_midlines(by, ty, 4)
+        xy[:100, 0] = rng.choice(x_mids, 100)
+        xy[100:200, 1] = rng.choice(y_mids, 100)
+        # high-variance values force splitting to max depth
+        values = rng.random(300) * 100
+
+        tree = PointQuadTree.from_points_bulk(xy, values, bounding_box=bbox)
+        assert leaf_containment_violations(tree) == 0
+        assert stored_point_count(tree) == 300
+
+
+def test_from_points_bulk_empty_input():
+    empty = np.empty((0, 2))
+    # no box to derive from: refuse clearly
+    with pytest.raises(ValueError, match="empty xy"):
+        PointQuadTree.from_points_bulk(empty)
+    # explicit box: empty tree
+    bbox = BoundingBox(0.0, 10.0, 10.0, 0.0)
+    tree = PointQuadTree.from_points_bulk(empty, bounding_box=bbox)
+    assert stored_point_count(tree) == 0
+    assert not tree._divided
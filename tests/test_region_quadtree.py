@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from pyquad import RegionQuadTree
+
+
+def assert_same_structure(a, b):
+    assert (a.ty, a.by, a.lx, a.rx) == (b.ty, b.by, b.lx, b.rx)
+    assert (a.quads is None) == (b.quads is None)
+    if a.quads is not None:
+        for qa, qb in zip(a.quads, b.quads):
+            assert_same_structure(qa, qb)
+
+
+def leaf_count(node):
+    if node.quads is None:
+        return 1
+    return sum(leaf_count(q) for q in node.quads)
+
+
+@pytest.mark.parametrize("use_std", [True, False])
+def test_kernel_matches_python_fallback(use_std):
+    # np.std/np.var take the jitted kernel; a plain wrapper of the same
+    # reduction is routed through the Python build, so the two trees
+    # must come out identical
+    rng = np.random.default_rng(3)
+    arrays = [
+        (rng.random((128, 96)) * 255).astype(np.uint8),
+        rng.random((100, 100)) * 50,
+    ]
+    flat = np.zeros((64, 64))
+    flat[10, 10] = 6.0
+    arrays.append(flat)
+
+    for arr in arrays:
+        for thresh in (0.5, 5, 50):
+            if use_std:
+                jit_func, py_func = np.std, lambda a: np.std(a)
+            else:
+                jit_func, py_func = np.var, lambda a: np.var(a)
+            jit_tree = RegionQuadTree(
+                arr, max_depth=5, split_func=jit_func, split_thresh=thresh
+            )
+            py_tree = RegionQuadTree(
+                arr, max_depth=5, split_func=py_func, split_thresh=thresh
+            )
+            assert_same_structure(jit_tree.root, py_tree.root)
+
+
+def test_quiet_root_stops_after_forced_split():
+    # A root whose criteria is under the threshold splits exactly once:
+    # four leaves, no descent into louder tiles below depth 1
+    arr = np.zeros((16, 16))
+    arr[3, 3] = 6.0
+    assert float(np.std(arr)) <= 0.5
+    tree = RegionQuadTree(arr, max_depth=7, split_thresh=0.5)
+    assert leaf_count(tree.root) == 4